@@ -0,0 +1,77 @@
+import importlib
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+unpackr = None
+_tmp = None
+_cwd = None
+
+
+def setUpModule():
+    # unpackr creates its logs folder in the working directory on import
+    global unpackr, _tmp, _cwd
+    _cwd = os.getcwd()
+    _tmp = tempfile.TemporaryDirectory()
+    os.chdir(_tmp.name)
+    unpackr = importlib.import_module('unpackr')
+
+
+def tearDownModule():
+    # The log file stays open otherwise, which blocks the cleanup on Windows
+    logging.getLogger().removeHandler(unpackr.log_handler)
+    unpackr.log_handler.close()
+    os.chdir(_cwd)
+    _tmp.cleanup()
+
+
+class ProcessFolderInterruptTest(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp(dir=_tmp.name))
+        self.folder = self.root / 'download'
+        self.destination = self.root / 'destination'
+        self.folder.mkdir()
+        self.destination.mkdir()
+        for i in range(12):
+            (self.folder / f'video{i:02}.mkv').write_bytes(b'x')
+
+    def test_ctrl_c_cancels_queued_health_checks(self):
+        checked = []
+        lock = threading.Lock()
+
+        def slow_health_check(video_file, hwaccel=False):
+            with lock:
+                checked.append(video_file)
+            time.sleep(0.5)
+            return True
+
+        def interrupt_on_health_check(pbar, description):
+            if description.startswith('Checking health'):
+                raise KeyboardInterrupt
+
+        with mock.patch.object(unpackr, 'HEALTH_CHECK_WORKERS', 2), \
+                mock.patch.object(unpackr, 'check_video_health', slow_health_check), \
+                mock.patch.object(unpackr, 'update_progress_bar', interrupt_on_health_check):
+            start = time.monotonic()
+            with self.assertRaises(KeyboardInterrupt):
+                unpackr.process_folder(self.folder, self.destination, pbar=None)
+            elapsed = time.monotonic() - start
+
+        # Give any checks that were wrongly left queued time to start
+        time.sleep(1.5)
+        self.assertLess(elapsed, 0.5)
+        self.assertLessEqual(len(checked), 2)
+        self.assertEqual(len(list(self.folder.glob('*.mkv'))), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,15 +10,20 @@ import time
 import psutil
 from pathlib import Path
 import subprocess
-import tempfile
+import traceback
 import datetime
 import glob
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from colorama import init, Fore, Style
 
 # Constants
 LOGS_FOLDER = Path('logs')
 LOG_FILE = LOGS_FOLDER / 'app.log'
-VIDEO_EXTENSIONS = ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.mpg', '.mpeg', '.m4v', '.3gp', '.webm']
+SCRIPT_DIR = Path(__file__).resolve().parent
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.mpg', '.mpeg', '.m4v', '.3gp', '.webm'})
+REMOVABLE_EXTENSIONS = frozenset({'.sfv', '.nfo', '.srr', '.srs', '.url', '.db', '.nzb', '.txt', '.xml', '.dat', '.exe', '.htm', '.log'})
+HEALTH_CHECK_WORKERS = min(4, os.cpu_count() or 1)  # Concurrent FFMPEG health checks per folder
 
 # Ensure the logs directory exists
 os.makedirs(LOGS_FOLDER, exist_ok=True)
@@ -90,44 +95,77 @@ def confirm_action() -> bool:
     confirmation = input(prompt).strip().lower()
     return confirmation in ['y', 'yes']
 
+def iter_files(folder: Path):
+    """
+    Recursively yields an os.DirEntry for every file under the given folder.
+    Walks the tree once with os.scandir, so each entry's type comes from the directory listing.
+    Subfolders that cannot be read are skipped.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_files(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except PermissionError as e:
+        logging.warning(f"Skipping unreadable folder {folder}: {e}")
+
 def count_all_files(folder: Path) -> int:
     """
     Counts all files in the given folder.
     """
-    return len([file for file in folder.rglob('*') if file.is_file()])
+    return sum(1 for _ in iter_files(folder))
 
 def find_video_files(folder: Path) -> list:
     """
     Recursively finds video files in the given folder.
     Returns a list of paths to video files.
     """
-    video_files = [file for file in folder.rglob('*') if file.suffix.lower() in VIDEO_EXTENSIONS]
+    video_files = [Path(entry.path) for entry in iter_files(folder)
+                   if os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS]
     return video_files
 
 def contains_non_video_files(folder: Path) -> bool:
     """
     Checks if the folder contains files other than the specified video files.
     """
-    all_files = [file for file in folder.rglob('*') if file.is_file()]
-    non_video_files = [file for file in all_files if file.suffix.lower() not in VIDEO_EXTENSIONS]
-    return len(non_video_files) > 0
+    return any(os.path.splitext(entry.name)[1].lower() not in VIDEO_EXTENSIONS for entry in iter_files(folder))
 
-def contains_unwanted_files(folder: Path) -> bool:
+def summarize_folder(folder: Path) -> tuple:
     """
-    Checks if the folder contains files other than video, PAR2, RAR, and allowable non-video files.
+    Walks the folder once and returns the number of video files it holds and whether it contains
+    unwanted files, i.e. anything other than video, PAR2 and RAR files.
     """
-    for file in folder.rglob('*'):
-        if file.is_file() and not (
-            file.suffix.lower() in VIDEO_EXTENSIONS or
-            file.suffix.lower() == '.par2' or
-            file.suffix.lower() == '.rar'
-        ):
-            return True
-    return False
+    video_count = 0
+    has_unwanted_files = False
+    for entry in iter_files(folder):
+        file_ext = os.path.splitext(entry.name)[1].lower()
+        if file_ext in VIDEO_EXTENSIONS:
+            video_count += 1
+        elif file_ext != '.par2' and file_ext != '.rar':
+            has_unwanted_files = True
+    return video_count, has_unwanted_files
+
+@functools.lru_cache(maxsize=None)
+def find_tool(name: str):
+    """
+    Resolves an external tool to its full path, looking in PATH and then the script directory.
+    Returns None if the tool cannot be found. The result is cached for the rest of the run.
+    """
+    tool_path = shutil.which(name) or shutil.which(name, path=str(SCRIPT_DIR))
+    if tool_path is None:
+        logging.warning(f"{name} was not found in PATH or {SCRIPT_DIR}. Steps that need it will be skipped.")
+    return tool_path
 
 def process_par2_files(folder: Path) -> bool:
+    par2 = find_tool('par2')
+    if par2 is None:
+        logging.error(f"PAR2 repair skipped for {folder}: par2 not found")
+        # Nothing was attempted, so keep the PAR2 files; they also keep the folder from being deleted
+        return True
     try:
-        process = subprocess.Popen(['par2', 'r', str(folder / '*.par2')],
+        process = subprocess.Popen([par2, 'r', str(folder / '*.par2')],
                                    stdout=subprocess.PIPE,
                                    stderr=subprocess.PIPE,
                                    text=True,
@@ -155,7 +193,12 @@ def delete_files_by_extension(folder: Path, extension: str):
 def process_rar_files(folder: Path) -> bool:
     try:
         for file in folder.glob('*.rar'):
-            process = subprocess.Popen(['7z', 'x', str(file), f'-o{folder}', '-aoa'], 
+            seven_zip = find_tool('7z')
+            if seven_zip is None:
+                logging.error(f"RAR extraction skipped for {folder}: 7z not found")
+                # Nothing was extracted, so keep the archives; they also keep the folder from being deleted
+                return True
+            process = subprocess.Popen([seven_zip, 'x', str(file), f'-o{folder}', '-aoa'], 
                                        stdout=subprocess.PIPE, 
                                        stderr=subprocess.PIPE, 
                                        text=True, 
@@ -167,9 +210,8 @@ def process_rar_files(folder: Path) -> bool:
                 # Continue to delete files even if there's an extraction error
         # Delete RAR files after extraction attempt
         delete_files_by_extension(folder, '.rar')
-        # Also delete related files like .r00, .r01, etc.
-        for ext in ['.r' + str(i).zfill(2) for i in range(100)]:
-            delete_files_by_extension(folder, ext)
+        # Also delete related volumes .r00 to .r99 with a single glob rather than one per volume number
+        delete_files_by_extension(folder, '.r[0-9][0-9]')
         return True  # Return true to indicate completion of the process
     except Exception as e:
         logging.error(f"Unexpected error during RAR extraction for {folder}: {e}")
@@ -178,13 +220,12 @@ def process_rar_files(folder: Path) -> bool:
 def wait_for_file_release(file_path, max_attempts=10, delay=1):
     for attempt in range(max_attempts):
         is_locked = False
-        for proc in psutil.process_iter(attrs=['pid', 'name']):
-            try:
-                if file_path in (f.path for f in proc.open_files()):
-                    is_locked = True
-                    break
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                continue  # Ignore processes that cannot be accessed
+        # Only fetch open_files; processes that cannot be accessed report None instead of raising
+        for proc in psutil.process_iter(attrs=['open_files']):
+            open_files = proc.info['open_files']
+            if open_files and any(f.path == file_path for f in open_files):
+                is_locked = True
+                break
 
         if not is_locked:
             return True
@@ -209,7 +250,7 @@ def safe_delete_folder(folder: Path):
         except Exception as e:
             logging.error(f"Repeated error deleting folder {folder}: {e}")
 
-def check_video_health(video_file: Path) -> bool:
+def check_video_health(video_file: Path, hwaccel: bool = False) -> bool:
     # Check if file size is 0 (0 KB)
     if video_file.stat().st_size == 0:
         logging.error(f"0 KB file detected and will be deleted: {video_file}")
@@ -220,19 +261,29 @@ def check_video_health(video_file: Path) -> bool:
             logging.error(f"Error deleting 0 KB file {video_file}: {e}")
         return False
 
+    ffmpeg = find_tool('ffmpeg')
+    if ffmpeg is None:
+        return True  # Health check is skipped when FFMPEG is not installed
+
+    command = [ffmpeg, '-v', 'error']
+    if hwaccel:
+        command += ['-hwaccel', 'auto']  # Opt-in: GPU decoders can report errors differently from the software decoder
+    command += ['-i', str(video_file), '-f', 'null', '-']
+
     try:
-        # Create a temporary file
-        with tempfile.TemporaryFile(mode='w+') as temp_output:
-            result = subprocess.run(['ffmpeg', '-v', 'error', '-i', str(video_file), '-f', 'null', '-'],
-                                    stdout=temp_output, stderr=temp_output, text=True)
-
-            # Check if ffmpeg found errors
-            temp_output.seek(0)  # Go to the start of the file to read content
-            output = temp_output.read()
-            if result.returncode != 0:
-                logging.error(f"Corrupt video file detected: {video_file}\n{output}")
-                return False
-            return True
+        # Collect ffmpeg's output in memory; with -v error it is only a few lines
+        result = subprocess.run(command,
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT,
+                                text=True,
+                                encoding='utf-8',
+                                errors='replace')
+
+        # Check if ffmpeg found errors
+        if result.returncode != 0:
+            logging.error(f"Corrupt video file detected: {video_file}\n{result.stdout}")
+            return False
+        return True
     except FileNotFoundError:
         logging.warning("FFMPEG is not installed. Skipping health check.")
         return True
@@ -253,39 +304,18 @@ def is_file_in_use(file_path: Path) -> bool:
             continue
     return False
 
-def delete_video_file_with_retry(file_path, max_attempts=5):
-    for attempt in range(max_attempts):
-        try:
-            # Try to open the file in exclusive mode
-            with open(file_path, 'a+') as f:
-                pass
-            # If successful, delete the file
-            os.remove(file_path)
-            logging.info(f"Successfully deleted video file: {file_path}")
-            return True
-        except PermissionError:
-            logging.error(f"Attempt {attempt + 1} - Error deleting video file {file_path}: Access is denied")
-        except FileNotFoundError:
-            logging.error(f"Attempt {attempt + 1} - Error deleting video file {file_path}: File not found")
-        except Exception as e:
-            logging.error(f"Attempt {attempt + 1} - Error deleting video file {file_path}: {e}")
-        time.sleep(1)  # Wait before retrying
-    logging.error(f"Failed to delete video file {file_path} after {max_attempts} attempts.")
-    return False
-
 def update_progress_bar(pbar, description):
     """
     Updates the progress bar with a custom description.
     """
+    # set_description() already redraws the bar, so no separate refresh() is needed
     pbar.set_description(description)
-    pbar.refresh()  # Refresh the progress bar to show the updated description immediately
 
 def is_folder_empty_or_removable(folder: Path, par2_error: bool, rar_error: bool) -> bool:
     """
     Checks if the folder is empty or contains only files that can be removed.
     This includes checking for errors in PAR2 and RAR processing.
     """
-    removable_extensions = ['.sfv', '.nfo', '.sfv', '.srr', '.srs', '.url', '.db', '.nzb', '.txt', '.xml', '.dat', '.exe', '.htm', '.log']
     jpg_count = 0
 
     for file in folder.iterdir():
@@ -299,7 +329,7 @@ def is_folder_empty_or_removable(folder: Path, par2_error: bool, rar_error: bool
             if jpg_count > 1:
                 logging.info(f"Folder '{folder}' not deleted: contains more than one JPG file '{file.name}'")
                 return False
-        elif file_ext in removable_extensions or (file_ext.startswith('.r') and file_ext[2:].isdigit()):
+        elif file_ext in REMOVABLE_EXTENSIONS or (file_ext.startswith('.r') and file_ext[2:].isdigit()):
             continue
         elif (file_ext == '.par2' and par2_error) or (file_ext == '.rar' and rar_error):
             continue  # Treat PAR2 or RAR files as removable if there were processing errors
@@ -314,42 +344,61 @@ def is_shortcut(file: Path) -> bool:
     """
     Checks if a file is a shortcut (e.g., .lnk in Windows).
     """
-    return file.suffix.lower() in ['.lnk', '.url']  # Add other shortcut types if needed
+    return file.suffix.lower() in {'.lnk', '.url'}  # Add other shortcut types if needed
 
-def terminate_related_processes(file_name, allowed_processes=['ffmpeg', '7z']):
+def terminate_related_processes(file_name, allowed_processes=frozenset({'ffmpeg', '7z'})):
     """
     Terminates processes that might be using the file.
     """
-    for process in psutil.process_iter():
+    terminated = []
+    for process in psutil.process_iter(attrs=['name']):
+        name = process.info['name'] or ''
+        # Match the executable name exactly, ignoring case and the Windows .exe suffix
+        if name.lower().removesuffix('.exe') not in allowed_processes:
+            continue
         try:
-            process_info = process.as_dict(attrs=['pid', 'name'])
-            if process_info['name'] in allowed_processes and file_name in process.cmdline():
+            if file_name in process.cmdline():
                 process.terminate()
-                logging.info(f"Terminated process {process_info['name']} (PID: {process_info['pid']}) that was using file {file_name}")
+                terminated.append(process)
+                logging.info(f"Terminated process {name} (PID: {process.pid}) that was using file {file_name}")
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             pass
 
-def process_subfolder(subfolder: Path, destination_dir: Path, pbar):
+    # Wait briefly for the processes to exit so the file is released, then force-kill any stragglers
+    _, alive = psutil.wait_procs(terminated, timeout=1)
+    for process in alive:
+        try:
+            process.kill()
+            logging.info(f"Killed process (PID: {process.pid}) that did not exit after terminate")
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+def process_subfolder(subfolder: Path, destination_dir: Path, pbar, hwaccel: bool = False):
     """
     Recursive function to process each subfolder.
     """
-    for sub in subfolder.iterdir():
+    entries = list(subfolder.iterdir())
+    # Count JPG files once here rather than re-listing the folder for every JPG
+    jpg_count = sum(1 for entry in entries if entry.match('*.jpg'))
+    for sub in entries:
         if sub.is_dir():
-            process_subfolder(sub, destination_dir, pbar)  # Recursive call for deeper subfolders
+            process_subfolder(sub, destination_dir, pbar, hwaccel)  # Recursive call for deeper subfolders
         else:
-            process_file(sub, destination_dir, pbar)
+            process_file(sub, destination_dir, pbar, jpg_count, hwaccel)
 
     # Check if the subfolder can be deleted after processing its contents
     if is_folder_empty_or_removable(subfolder, False, False):  # Assuming no PAR2 or RAR files in subfolders
         safe_delete_folder(subfolder)
         logging.info(f"Deleted subfolder after processing: {subfolder}")
 
-def process_file(file: Path, destination_dir: Path, pbar):
+def process_file(file: Path, destination_dir: Path, pbar, jpg_count: int, hwaccel: bool = False):
     """
     Processes individual files within folders and subfolders.
+    jpg_count is the number of JPG files in the file's folder.
     """
-    if file.suffix.lower() in VIDEO_EXTENSIONS:
-        if check_video_health(file):
+    file_ext = file.suffix.lower()
+    if file_ext in VIDEO_EXTENSIONS:
+        if check_video_health(file, hwaccel):
             try:
                 destination_file = destination_dir / file.name
                 shutil.move(str(file), str(destination_file))
@@ -362,12 +411,13 @@ def process_file(file: Path, destination_dir: Path, pbar):
                 logging.error(f"Corrupt video file detected and deleted: {file}")
             except Exception as e:
                 logging.error(f"Error deleting corrupt video file {file}: {e}")
-    elif file.suffix.lower() in ['.jpg'] and len(list(file.parent.glob('*.jpg'))) == 1:  # Single JPG file in folder
-        try:
-            file.unlink(missing_ok=True)
-            logging.info(f"Deleted single JPG file: {file}")
-        except Exception as e:
-            logging.error(f"Error deleting JPG file {file}: {e}")
+    elif file_ext == '.jpg':
+        if jpg_count == 1:  # Single JPG file in folder
+            try:
+                file.unlink(missing_ok=True)
+                logging.info(f"Deleted single JPG file: {file}")
+            except Exception as e:
+                logging.error(f"Error deleting JPG file {file}: {e}")
 
 def delete_video_file_with_retry(video_file: Path, max_attempts: int = 5, retry_delay_seconds: int = 1):
     for attempt in range(max_attempts):
@@ -386,7 +436,7 @@ def delete_video_file_with_retry(video_file: Path, max_attempts: int = 5, retry_
     logging.error(f"Failed to delete video file {video_file} after {max_attempts} attempts.")
     return False
 
-def process_folder(folder: Path, destination_dir: Path, pbar):
+def process_folder(folder: Path, destination_dir: Path, pbar, hwaccel: bool = False):
     """
     Processes the given folder for video, PAR2, and RAR files.
     Moves video files to a specified destination and cleans up the folder.
@@ -407,27 +457,36 @@ def process_folder(folder: Path, destination_dir: Path, pbar):
     # Process each subfolder
     for subfolder in folder.iterdir():
         if subfolder.is_dir():
-            process_subfolder(subfolder, destination_dir, pbar)
+            process_subfolder(subfolder, destination_dir, pbar, hwaccel)
 
     # Retrieve all video files after RAR and PAR2 processing
     all_video_files = find_video_files(folder)
 
     # Process all video files (including newly extracted ones)
-    for video_file in all_video_files:
-        update_progress_bar(pbar, f"Checking health of video file {video_file.name}")
-        if check_video_health(video_file):
-            try:
-                destination_file = destination_dir / video_file.name
-                shutil.move(str(video_file), str(destination_file))
-                logging.info(f"Video file verified and moved: {destination_file}")
-            except Exception as e:
-                logging.error(f"Error moving file {video_file}: {e}")
-        else:
-            # Before attempting to delete the file, wait for it to be released
-            if wait_for_file_release(str(video_file)):
-                delete_video_file_with_retry(video_file)
+    # Health checks run concurrently; moves and deletes happen here, in order, as results arrive
+    executor = ThreadPoolExecutor(max_workers=HEALTH_CHECK_WORKERS)
+    try:
+        health_checks = [executor.submit(check_video_health, video_file, hwaccel) for video_file in all_video_files]
+        for video_file, health_check in zip(all_video_files, health_checks):
+            update_progress_bar(pbar, f"Checking health of video file {video_file.name}")
+            if health_check.result():
+                try:
+                    destination_file = destination_dir / video_file.name
+                    shutil.move(str(video_file), str(destination_file))
+                    logging.info(f"Video file verified and moved: {destination_file}")
+                except Exception as e:
+                    logging.error(f"Error moving file {video_file}: {e}")
             else:
-                logging.error(f"Timeout waiting for file release: {video_file}")
+                # Before attempting to delete the file, wait for it to be released
+                if wait_for_file_release(str(video_file)):
+                    delete_video_file_with_retry(video_file)
+                else:
+                    logging.error(f"Timeout waiting for file release: {video_file}")
+    except BaseException:
+        # Drop the queued checks so Ctrl+C does not wait for every remaining video to be decoded
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
 
     # Final folder check
     update_progress_bar(pbar, f"Finalizing folder {folder.name}")
@@ -445,6 +504,7 @@ def main():
     parser = argparse.ArgumentParser(description="Automated video file processing script.")
     parser.add_argument('--source', help='Path to the source downloads directory.', required=False)
     parser.add_argument('--destination', help='Path to the destination directory.', required=False)
+    parser.add_argument('--hwaccel', action='store_true', help='Let FFMPEG use hardware decoding for video health checks.')
     args = parser.parse_args()
 
     if args.source and args.destination:
@@ -458,25 +518,35 @@ def main():
         download_dir = get_user_input("Enter the path to your downloads directory: ")
         destination_dir = get_user_input("Enter the path to your destination directory: ")
 
-    print(Style.BRIGHT + Fore.RED + "IMPORTANT WARNING:" + Style.RESET_ALL)
-    print(f"The process will scan the directory: {Fore.CYAN}{download_dir}{Style.RESET_ALL}")
-    print(f"Video files will be moved to the destination directory: {Fore.CYAN}{destination_dir}{Style.RESET_ALL}")
-    print("Actions to be performed:")
-    print(Fore.YELLOW + " - Scan for videos, check their health with ffmpeg." + Style.RESET_ALL)
-    print(Fore.YELLOW + " - Scan for PAR2 and RAR files." + Style.RESET_ALL)
-    print(Fore.YELLOW + " - Move healthy video files to: " + str(destination_dir) + Style.RESET_ALL)
-    print(Fore.YELLOW + " - Repair files using PAR2 and extract RAR archives." + Style.RESET_ALL)
-    print(Fore.YELLOW + " - Delete folders that have been processed." + Style.RESET_ALL)
-    print("This action is irreversible and may lead to data loss. Ensure you have backups if necessary.")
-    print("All actions will be logged to: " + str(LOG_FILE))
-    print("\nProcessing will automatically start in 10 seconds. To cancel, press Ctrl+C now.")
-
+    # Emit the warning as one write rather than a print per line
+    warning = [
+        Style.BRIGHT + Fore.RED + "IMPORTANT WARNING:" + Style.RESET_ALL,
+        f"The process will scan the directory: {Fore.CYAN}{download_dir}{Style.RESET_ALL}",
+        f"Video files will be moved to the destination directory: {Fore.CYAN}{destination_dir}{Style.RESET_ALL}",
+        "Actions to be performed:",
+        Fore.YELLOW + " - Scan for videos, check their health with ffmpeg." + Style.RESET_ALL,
+        Fore.YELLOW + " - Scan for PAR2 and RAR files." + Style.RESET_ALL,
+        Fore.YELLOW + " - Move healthy video files to: " + str(destination_dir) + Style.RESET_ALL,
+        Fore.YELLOW + " - Repair files using PAR2 and extract RAR archives." + Style.RESET_ALL,
+        Fore.YELLOW + " - Delete folders that have been processed." + Style.RESET_ALL,
+        "This action is irreversible and may lead to data loss. Ensure you have backups if necessary.",
+        "All actions will be logged to: " + str(LOG_FILE),
+        "\nProcessing will automatically start in 10 seconds. To cancel, press Ctrl+C now.",
+    ]
+    sys.stdout.write("\n".join(warning) + "\n")
+    sys.stdout.flush()
+
+    # Only redraw the countdown in place on a terminal; piped output keeps its normal buffering
+    interactive = sys.stdout.isatty()
     try:
-        for i in range(10, 0, -1):
-            sys.stdout.write(f"\r{Fore.GREEN}Starting in {i} seconds... (Press Ctrl+C to cancel) {Style.RESET_ALL}")
-            sys.stdout.flush()
-            time.sleep(1)
-        sys.stdout.write("\r" + " " * 60 + "\r")
+        if interactive:
+            for i in range(10, 0, -1):
+                sys.stdout.write(f"\r{Fore.GREEN}Starting in {i} seconds... (Press Ctrl+C to cancel) {Style.RESET_ALL}")
+                sys.stdout.flush()
+                time.sleep(1)
+            sys.stdout.write("\r" + " " * 60 + "\r")
+        else:
+            time.sleep(10)  # Nothing is drawn, so wait out the countdown in one go
     except KeyboardInterrupt:
         print(Fore.RED + "\nOperation cancelled by user." + Style.RESET_ALL)
         sys.exit(1)
@@ -492,14 +562,14 @@ def main():
 
     with tqdm(total=len(folders), unit="folder") as pbar:
         for folder in folders:
-            video_files_before = len(find_video_files(folder))
+            video_files_before, has_unwanted_files = summarize_folder(folder)
             if video_files_before == 0:
                 blank_folders += 1
 
-            if contains_unwanted_files(folder):
+            if has_unwanted_files:
                 folders_with_unwanted_files += 1
 
-            process_folder(folder, destination_dir, pbar)
+            process_folder(folder, destination_dir, pbar, args.hwaccel)
 
             if folder.exists() and contains_non_video_files(folder):
                 folders_with_non_video_files += 1
@@ -510,13 +580,18 @@ def main():
 
             pbar.update(1)
 
-    print(Fore.GREEN + "\nProcessing complete." + Style.RESET_ALL)
-    print(f"Total folders processed: {len(folders)}")
-    print(f"Total video files moved: {total_video_files_moved}")
-    print(f"Total folders deleted: {total_folders_deleted}")
-    print(f"Blank folders: {blank_folders}")
-    print(f"Folders with non-video files: {folders_with_non_video_files}")
-    print(f"Folders with unwanted files: {folders_with_unwanted_files}")
+    # Emit the summary as one write rather than a print per line
+    summary = [
+        Fore.GREEN + "\nProcessing complete." + Style.RESET_ALL,
+        f"Total folders processed: {len(folders)}",
+        f"Total video files moved: {total_video_files_moved}",
+        f"Total folders deleted: {total_folders_deleted}",
+        f"Blank folders: {blank_folders}",
+        f"Folders with non-video files: {folders_with_non_video_files}",
+        f"Folders with unwanted files: {folders_with_unwanted_files}",
+    ]
+    sys.stdout.write("\n".join(summary) + "\n")
+    sys.stdout.flush()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file